@@ -479,18 +479,15 @@ class QRoute(QComponent):
         Returns:
             np.ndarray: ((H+N+T)x2) all points (x,y) of the CPW
         """
+        parts = [self.head.pts]
         # cover case where there is no intermediate points (straight connection between lead ends)
-        if self.intermediate_pts is None:
-            beginning = self.head.pts
-        else:
-            beginning = np.concatenate([self.head.pts, self.intermediate_pts],
-                                       axis=0)
-
+        if self.intermediate_pts is not None:
+            parts.append(self.intermediate_pts)
         # cover case where there is no tail defined (floating end)
-        if self.tail is None:
-            polished = beginning
-        else:
-            polished = np.concatenate([beginning, self.tail.pts[::-1]], axis=0)
+        if self.tail is not None:
+            parts.append(self.tail.pts[::-1])
+        # single allocation for all the points
+        polished = np.concatenate(parts, axis=0)
 
         polished = self.del_colinear_points(polished)
 
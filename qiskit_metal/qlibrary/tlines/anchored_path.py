@@ -19,14 +19,22 @@ from collections import OrderedDict
 from qiskit_metal import Dict
 from qiskit_metal.qlibrary.core import QRoute, QRoutePoint
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
+from qiskit_metal.toolbox_metal import _geom_numba
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalDesignError
+from qiskit_metal.toolbox_metal.parsing import is_true
 from collections.abc import Mapping
+import shapely
 from shapely.ops import unary_union
 from shapely.geometry import CAP_STYLE
+from shapely.strtree import STRtree
 import geopandas as gpd
 
+# Past this many components, the bounding boxes are indexed in an STRtree
+STRTREE_MIN_BOXES = 32
 
-def intersecting(a: np.array, b: np.array, c: np.array, d: np.array) -> bool:
+
+def intersecting(ax: float, ay: float, bx: float, by: float, cx: float,
+                 cy: float, dx: float, dy: float) -> bool:
     """Returns whether segment ab intersects or overlaps with segment cd, where
     a, b, c, and d are all coordinates.
 
@@ -34,67 +42,120 @@ def intersecting(a: np.array, b: np.array, c: np.array, d: np.array) -> bool:
         Anchored Path
 
     Args:
-        a (np.array): Coordinate
-        b (np.array): Coordinate
-        c (np.array): Coordinate
-        d (np.array): Coordinate
+        ax (float): x coordinate of a
+        ay (float): y coordinate of a
+        bx (float): x coordinate of b
+        by (float): y coordinate of b
+        cx (float): x coordinate of c
+        cy (float): y coordinate of c
+        dx (float): x coordinate of d
+        dy (float): y coordinate of d
 
     Returns:
         bool: True if intersecting, False otherwise
     """
+    return _geom_numba.segments_intersect(ax, ay, bx, by, cx, cy, dx, dy)
 
-    x0_start, y0_start = a
-    x0_end, y0_end = b
-    x1_start, y1_start = c
-    x1_end, y1_end = d
-    if (x0_start == x0_end) and (x1_start == x1_end):
-        # 2 vertical lines intersect only if they completely overlap at some point(s)
-        if x0_end == x1_start:
-            # Same x-intercept -> potential overlap, so check y coordinate
-            # Distinct, non-overlapping segments if and only if min y coord of one is above max y coord of the other
-            return not ((min(y0_start, y0_end) > max(y1_start, y1_end)) or
-                        (min(y1_start, y1_end) > max(y0_start, y0_end)))
-        return False  # Parallel lines with different x-intercepts don't overlap
-    elif (x0_start == x0_end) or (x1_start == x1_end):
-        # One segment is vertical, the other is not
-        # Express non-vertical line in the form of y = mx + b and check y value
-        if x1_start == x1_end:
-            # Exchange names; the analysis below assumes that line 0 is the vertical one
-            x0_start, x0_end, x1_start, x1_end = x1_start, x1_end, x0_start, x0_end
-            y0_start, y0_end, y1_start, y1_end = y1_start, y1_end, y0_start, y0_end
-        m = (y1_end - y1_start) / (x1_end - x1_start)
-        b = (x1_end * y1_start - x1_start * y1_end) / (x1_end - x1_start)
-        if min(x1_start, x1_end) <= x0_start <= max(x1_start, x1_end):
-            if min(y0_start, y0_end) <= m * x0_start + b <= max(
-                    y0_start, y0_end):
-                return True
-        return False
-    else:
-        # Neither line is vertical; check slopes and y-intercepts
-        b0 = (y0_start * x0_end - y0_end * x0_start) / (
-            x0_end - x0_start)  # y-intercept of line 0
-        b1 = (y1_start * x1_end - y1_end * x1_start) / (
-            x1_end - x1_start)  # y-intercept of line 1
-        if (x1_end - x1_start) * (y0_end - y0_start) == (x0_end - x0_start) * (
-                y1_end - y1_start):
-            # Lines have identical slopes
-            if b0 == b1:
-                # Same y-intercept -> potential overlap, so check x coordinate
-                # Distinct, non-overlapping segments if and only if min x coord of one exceeds max x coord of the other
-                return not ((min(x0_start, x0_end) > max(x1_start, x1_end)) or
-                            (min(x1_start, x1_end) > max(x0_start, x0_end)))
-            return False  # Parallel lines with different y-intercepts don't overlap
-        else:
-            # Lines not parallel so must intersect somewhere -> examine slopes m0 and m1
-            m0 = (y0_end - y0_start) / (x0_end - x0_start)  # slope of line 0
-            m1 = (y1_end - y1_start) / (x1_end - x1_start)  # slope of line 1
-            x_intersect = (b1 - b0) / (m0 - m1
-                                      )  # x coordinate of intersection point
-            if min(x0_start, x0_end) <= x_intersect <= max(x0_start, x0_end):
-                if min(x1_start, x1_end) <= x_intersect <= max(
-                        x1_start, x1_end):
-                    return True
-            return False
+
+def _dot2(vector_1: np.array, vector_2: np.array) -> float:
+    """Same as mao.dot(), for 2D vectors only.
+
+    Spelling out the 2 products avoids the numpy call overhead, which
+    dominates for such small vectors.
+
+    Args:
+        vector_1 (np.array): First of the dot product vectors
+        vector_2 (np.array): Second of the dot product vectors
+
+    Returns:
+        float: Rounded dot product
+    """
+    return round(vector_1[0] * vector_2[0] + vector_1[1] * vector_2[1],
+                 mao.DECIMAL_PRECISION)
+
+
+def segment_hits_bboxes(a: np.array, b: np.array,
+                        bboxes: np.ndarray) -> np.ndarray:
+    """Returns, for each axis-aligned bounding box, whether segment ab
+    intersects or overlaps with its perimeter. All the boxes are tested at
+    once, and so are several segments if a and b are arrays of coordinates.
+
+    .. meta::
+        Anchored Path
+
+    Args:
+        a (np.array): Coordinate, or Sx2 array of the start of S segments
+        b (np.array): Coordinate, or Sx2 array of the end of S segments
+        bboxes (np.ndarray): Mx4 array of (xmin, ymin, xmax, ymax) rows
+
+    Returns:
+        np.ndarray: Boolean mask of length M (SxM for S segments), True where
+        the perimeter is hit
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    lo = np.minimum(a, b)[..., np.newaxis, :]
+    hi = np.maximum(a, b)[..., np.newaxis, :]
+    # Cheap rejection of the boxes that don't overlap the bounding box of ab
+    hits = ~(np.any(bboxes[:, 2:] < lo, axis=-1) |
+             np.any(bboxes[:, :2] > hi, axis=-1))
+    survivors = np.nonzero(hits)
+    xmin, ymin, xmax, ymax = bboxes[survivors[-1]].T
+    a, b = a[survivors[:-1]], b[survivors[:-1]]
+    ax, ay, bx, by = a[..., 0], a[..., 1], b[..., 0], b[..., 1]
+    # The line through ab separates the segment from the box if and only if
+    # all 4 corners lie strictly on the same side of it
+    dx, dy = bx - ax, by - ay
+    orient = np.stack([
+        dx * (y - ay) - dy * (x - ax)
+        for x, y in ((xmin, ymin), (xmin, ymax), (xmax, ymin), (xmax, ymax))
+    ])
+    separated = np.all(orient > 0, axis=0) | np.all(orient < 0, axis=0)
+    # A segment lying strictly inside the box never touches the perimeter
+    lo, hi = np.minimum(a, b), np.maximum(a, b)
+    inside = ((xmin < lo[..., 0]) & (hi[..., 0] < xmax) & (ymin < lo[..., 1]) &
+              (hi[..., 1] < ymax))
+    hits[survivors] = ~(separated | inside)
+    return hits
+
+
+def _segments_hit_bboxes(segments: np.ndarray,
+                         bboxes: np.ndarray) -> np.ndarray:
+    """Dispatches segment_hits_bboxes() to its numba kernel when available.
+
+    Args:
+        segments (np.ndarray): Sx2x2 array of S segments, 2 vertices each
+        bboxes (np.ndarray): Mx4 array of (xmin, ymin, xmax, ymax) rows
+
+    Returns:
+        np.ndarray: SxM boolean mask, True where the perimeter is hit
+    """
+    if _geom_numba.IS_COMPILED:
+        return _geom_numba.segments_hit_bboxes(segments.reshape(-1, 4), bboxes)
+    return segment_hits_bboxes(segments[:, 0], segments[:, 1], bboxes)
+
+
+def _segments_hit_bboxes_tree(segments: np.ndarray, bboxes: np.ndarray,
+                              tree: STRtree) -> np.ndarray:
+    """Same as _segments_hit_bboxes(), but only tests the boxes whose extent
+    overlaps that of each segment, as found by querying tree.
+
+    Args:
+        segments (np.ndarray): Sx2x2 array of S segments, 2 vertices each
+        bboxes (np.ndarray): Mx4 array of (xmin, ymin, xmax, ymax) rows
+        tree (STRtree): STRtree of the M boxes, in the same order
+
+    Returns:
+        np.ndarray: SxM boolean mask, True where the perimeter is hit
+    """
+    hits = np.zeros((len(segments), len(bboxes)), dtype=bool)
+    seg_idx, box_idx = tree.query(shapely.linestrings(segments))
+    for i in np.unique(seg_idx):
+        candidates = box_idx[seg_idx == i]
+        candidate_hits = _segments_hit_bboxes(segments[i:i + 1],
+                                              bboxes[candidates])
+        hits[i, candidates] = candidate_hits[0]
+    return hits
 
 
 class RouteAnchors(QRoute):
@@ -136,6 +197,12 @@ class RouteAnchors(QRoute):
 
     TOOLTIP = """Creates and connects a series of anchors through which the Route passes."""
 
+    _bbox_cache = None
+    """Names, bounding boxes and STRtree of the other components, cached during make()"""
+
+    _avoid_collision = None
+    """Parsed advanced.avoid_collision option, cached during make()"""
+
     from shapely.ops import unary_union
     from matplotlib import pyplot as plt
     import geopandas as gpd
@@ -163,15 +230,80 @@ class RouteAnchors(QRoute):
         polygons = self.design.components[component_name].qgeometry_list('poly')
         boundary = gpd.GeoSeries(unary_union(polygons + paths_converted))
         boundary_coords = list(boundary.geometry.exterior[0].coords)
-        if any(
-                intersecting(segment[0], segment[1], boundary_coords[i],
-                             boundary_coords[i + 1])
-                for i in range(len(boundary_coords) - 1)):
-            # At least 1 intersection with the actual component contour; do not proceed!
-            return False
+        (ax, ay), (bx, by) = segment
+        sx0, sx1 = (ax, bx) if ax < bx else (bx, ax)
+        sy0, sy1 = (ay, by) if ay < by else (by, ay)
+        for (cx, cy), (dx, dy) in zip(boundary_coords[:-1],
+                                      boundary_coords[1:]):
+            if (cx < sx0 and dx < sx0) or (cx > sx1 and dx > sx1) or (
+                    cy < sy0 and dy < sy0) or (cy > sy1 and dy > sy1):
+                # Edge lies entirely on one side of the bounding box of the segment
+                continue
+            if intersecting(ax, ay, bx, by, cx, cy, dx, dy):
+                # At least 1 intersection with the actual component contour; do not proceed!
+                return False
         # All clear, no intersections
         return True
 
+    def _fetch_component_bboxes(self) -> tuple:
+        """Fetches the bounding boxes of all the other components in the
+        design.
+
+        Returns:
+            tuple: list of component names, the (M, 4) float array of their
+            (xmin, ymin, xmax, ymax) bounding boxes in the same order, and
+            an STRtree of the boxes if there are at least STRTREE_MIN_BOXES
+            of them (None otherwise)
+        """
+        names = [
+            component for component in self.design.components
+            if component != self.name
+        ]
+        bboxes = np.array([
+            self.design.components[component].qgeometry_bounds()
+            for component in names
+        ],
+                          dtype=float).reshape(-1, 4)
+        tree = None
+        if len(names) >= STRTREE_MIN_BOXES:
+            tree = STRtree(shapely.box(*bboxes.T))
+        return names, bboxes, tree
+
+    def _component_bboxes(self) -> tuple:
+        """Same as _fetch_component_bboxes(), but during make() returns the
+        bounding boxes fetched once at its start.
+
+        Returns:
+            tuple: list of component names, the (M, 4) float array of their
+            bounding boxes and their STRtree (or None)
+        """
+        if self._bbox_cache is None:
+            return self._fetch_component_bboxes()
+        return self._bbox_cache
+
+    def _any_hits_batch(self, segments: np.ndarray) -> np.ndarray:
+        """Checks at once which of the given segments intersect or overlap
+        a component of self.design, see unobstructed().
+
+        Args:
+            segments (np.ndarray): Sx2x2 array of S segments, 2 vertices each
+
+        Returns:
+            np.ndarray: Boolean mask of length S, True where there is an obstacle
+        """
+        names, bboxes, tree = self._component_bboxes()
+        if tree is None:
+            hits = _segments_hit_bboxes(segments, bboxes)
+        else:
+            hits = _segments_hit_bboxes_tree(segments, bboxes, tree)
+        obstructed = np.zeros(len(segments), dtype=bool)
+        for i, j in zip(*np.nonzero(hits)):
+            # At least 1 intersection with the component bounding box. Check the actual contour.
+            if not obstructed[i]:
+                obstructed[i] = not self.unobstructed_close_up(
+                    list(segments[i]), names[j])
+        return obstructed
+
     def unobstructed(self, segment: list) -> bool:
         """Check that no component's bounding box in self.design intersects or
         overlaps a given segment.
@@ -182,29 +314,24 @@ class RouteAnchors(QRoute):
         Returns:
             bool: True is no obstacles
         """
+        (ax, ay), (bx, by) = segment
+        return self.unobstructed_xy(ax, ay, bx, by)
 
-        # assumes rectangular bounding boxes
-        for component in self.design.components:
-            if component == self.name:
-                continue
-            xmin, ymin, xmax, ymax = self.design.components[
-                component].qgeometry_bounds()
-            # p, q, r, s are corner coordinates of each bounding box
-            p, q, r, s = [
-                np.array([xmin, ymin]),
-                np.array([xmin, ymax]),
-                np.array([xmax, ymin]),
-                np.array([xmax, ymax])
-            ]
-            if any(
-                    intersecting(segment[0], segment[1], k, l)
-                    for k, l in [(p, q), (p, r), (r, s), (q, s)]):
-                # At least 1 intersection with the component bounding box. Check the actual contour.
-                if not self.unobstructed_close_up(segment, component):
-                    # At least 1 intersection with the actual component contour; do not proceed!
-                    return False
-        # All clear, no intersections
-        return True
+    def unobstructed_xy(self, ax: float, ay: float, bx: float,
+                        by: float) -> bool:
+        """Same as unobstructed(), for the segment from (ax, ay) to (bx, by).
+
+        Args:
+            ax (float): x coordinate of the start of the segment
+            ay (float): y coordinate of the start of the segment
+            bx (float): x coordinate of the end of the segment
+            by (float): y coordinate of the end of the segment
+
+        Returns:
+            bool: True is no obstacles
+        """
+        segments = np.array([[[ax, ay], [bx, by]]], dtype=float)
+        return not self._any_hits_batch(segments)[0]
 
     def connect_simple(self, start_pt: QRoutePoint,
                        end_pt: QRoutePoint) -> np.ndarray:
@@ -221,7 +348,10 @@ class RouteAnchors(QRoute):
         Raises:
             QiskitMetalDesignError: If the connect_simple() has failed.
         """
-        avoid_collision = self.parse_options().advanced.avoid_collision
+        avoid_collision = self._avoid_collision
+        if avoid_collision is None:
+            avoid_collision = is_true(
+                self.parse_options().advanced.avoid_collision)
 
         start_direction = start_pt.direction
         start = start_pt.position
@@ -234,10 +364,11 @@ class RouteAnchors(QRoute):
 
         if (start[0] == end[0]) or (start[1] == end[1]):
             # Matching x or y coordinates -> check if endpoints can be connected with a single segment
-            if mao.dot(start_direction, end - start) >= 0:
+            displacement = end - start
+            if _dot2(start_direction, displacement) >= 0:
                 # Start direction and end - start for CPW must not be anti-aligned
-                if (end_direction is None) or (mao.dot(end - start,
-                                                       end_direction) <= 0):
+                if (end_direction is None) or (_dot2(displacement,
+                                                     end_direction) <= 0):
                     # If leadout + end has been reached, the single segment CPW must not be aligned with its direction
                     return np.empty((0, 2), float)
         else:
@@ -246,84 +377,68 @@ class RouteAnchors(QRoute):
             # and check if both start and end directions are aligned with
             # the displacement vectors between start/end and
             # either of the 2 remaining corners ("perfect alignment").
-            corner1 = np.array([start[0],
-                                end[1]])  # x coordinate matches with start
-            corner2 = np.array([end[0],
-                                start[1]])  # x coordinate matches with end
-            if avoid_collision:
-                # Check for collisions at the outset to avoid repeat work
-                startc1end = bool(
-                    self.unobstructed([start, corner1]) and
-                    self.unobstructed([corner1, end]))
-                startc2end = bool(
-                    self.unobstructed([start, corner2]) and
-                    self.unobstructed([corner2, end]))
-            else:
-                startc1end = startc2end = True
-            if (mao.dot(start_direction, corner1 - start) > 0) and startc1end:
-                # corner1 is "in front of" the start_pt
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner1 - end) >= 0):
-                    # corner1 is also "in front of" the end_pt
-                    return np.expand_dims(corner1, axis=0)
-            elif (mao.dot(start_direction, corner2 - start) > 0) and startc2end:
-                # corner2 is "in front of" the start_pt
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner2 - end) >= 0):
-                    # corner2 is also "in front of" the end_pt
-                    return np.expand_dims(corner2, axis=0)
-            # In notation below, corners 3 and 4 correspond to
-            # the ends of the segment bisecting the longer rectangle formed by start and end
+            # corner1's x coordinate matches with start, corner2's with end.
+            # Corners 3 and 4 correspond to the ends of the segment bisecting
+            # the longer rectangle formed by start and end
             # while the segment formed by corners 5 and 6 bisect the shorter rectangle
+            mid = (start + end) / 2
             if stop_direction[
                     0]:  # "Wide" rectangle -> vertical middle segment is more natural
-                corner3 = np.array([(start[0] + end[0]) / 2, start[1]])
-                corner4 = np.array([(start[0] + end[0]) / 2, end[1]])
-                corner5 = np.array([start[0], (start[1] + end[1]) / 2])
-                corner6 = np.array([end[0], (start[1] + end[1]) / 2])
+                corners = np.array([[start[0], end[1]], [end[0], start[1]],
+                                    [mid[0], start[1]], [mid[0], end[1]],
+                                    [start[0], mid[1]], [end[0], mid[1]]])
             else:  # "Tall" rectangle -> horizontal middle segment is more natural
-                corner3 = np.array([start[0], (start[1] + end[1]) / 2])
-                corner4 = np.array([end[0], (start[1] + end[1]) / 2])
-                corner5 = np.array([(start[0] + end[0]) / 2, start[1]])
-                corner6 = np.array([(start[0] + end[0]) / 2, end[1]])
+                corners = np.array([[start[0], end[1]], [end[0], start[1]],
+                                    [start[0], mid[1]], [end[0], mid[1]],
+                                    [mid[0], start[1]], [mid[0], end[1]]])
+            # Alignment of each corner with the start and end directions
+            ds = mao.round((corners - start) @ start_direction)
+            if end_direction is None:
+                # Every corner is acceptable when approaching the end
+                de = np.ones(len(corners))
+            else:
+                de = mao.round((corners - end) @ end_direction)
             if avoid_collision:
-                startc3c4end = bool(
-                    self.unobstructed([start, corner3]) and
-                    self.unobstructed([corner3, corner4]) and
-                    self.unobstructed([corner4, end]))
-                startc5c6end = bool(
-                    self.unobstructed([start, corner5]) and
-                    self.unobstructed([corner5, corner6]) and
-                    self.unobstructed([corner6, end]))
+                # Check all the candidate paths for collisions at the outset to avoid repeat work.
+                # Vertices are indexed as 0: start, 1-6: corner1-corner6, 7: end
+                vertices = np.vstack((start, corners, end))
+                paths = ((0, 1, 7), (0, 2, 7), (0, 3, 4, 7), (0, 5, 6, 7))
+                segments = [(path[k], path[k + 1])
+                            for path in paths
+                            for k in range(len(path) - 1)]
+                obstructed = self._any_hits_batch(vertices[np.array(segments)])
+                # Split the segments results back into their path
+                splits = np.cumsum([len(path) - 1 for path in paths])[:-1]
+                startc1end, startc2end, startc3c4end, startc5c6end = (
+                    not any(hits) for hits in np.split(obstructed, splits))
             else:
-                startc3c4end = startc5c6end = True
-            if (mao.dot(start_direction, stop_direction) < 0) and (mao.dot(
-                    start_direction, corner3 - start) > 0) and startc3c4end:
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner4 - end) > 0):
+                startc1end = startc2end = startc3c4end = startc5c6end = True
+            if (ds[0] > 0) and startc1end:
+                # corner1 is "in front of" the start_pt
+                if de[0] >= 0:
+                    # corner1 is also "in front of" the end_pt
+                    return corners[0:1]
+            elif (ds[1] > 0) and startc2end:
+                # corner2 is "in front of" the start_pt
+                if de[1] >= 0:
+                    # corner2 is also "in front of" the end_pt
+                    return corners[1:2]
+            if (_dot2(start_direction, stop_direction) <
+                    0) and (ds[2] > 0) and startc3c4end:
+                if de[3] > 0:
                     # Perfectly aligned S-shaped CPW
-                    return np.vstack((corner3, corner4))
+                    return corners[2:4]
             # Relax constraints and check if imperfect 2-segment or S-segment works,
             # where "imperfect" means 1 or more dot products of directions
             # between successive segments is 0; otherwise return an empty list
-            if (mao.dot(start_direction, corner1 - start) >= 0) and startc1end:
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner1 - end) >= 0):
-                    return np.expand_dims(corner1, axis=0)
-            if (mao.dot(start_direction, corner2 - start) >= 0) and startc2end:
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner2 - end) >= 0):
-                    return np.expand_dims(corner2, axis=0)
-            if (mao.dot(start_direction, corner3 - start) >=
-                    0) and startc3c4end:
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner4 - end) >= 0):
-                    return np.vstack((corner3, corner4))
-            if (mao.dot(start_direction, corner5 - start) >=
-                    0) and startc5c6end:
-                if (end_direction is None) or (mao.dot(end_direction,
-                                                       corner6 - end) >= 0):
-                    return np.vstack((corner5, corner6))
+            if (ds[0] >= 0) and startc1end and (de[0] >= 0):
+                return corners[0:1]
+            if (ds[1] >= 0) and startc2end and (de[1] >= 0):
+                return corners[1:2]
+            if (ds[2] >= 0) and startc3c4end and (de[3] >= 0):
+                return corners[2:4]
+            if (ds[4] >= 0) and startc5c6end and (de[5] >= 0):
+                return corners[4:6]
         raise QiskitMetalDesignError(
             "connect_simple() has failed. This might be due to one of two reasons. "
             f"1. Either one of the start point {start} or the end point {end} "
@@ -379,32 +494,46 @@ class RouteAnchors(QRoute):
         """Generates path from start pin to end pin."""
         p = self.parse_options()
         anchors = p.anchors
-
-        # Set the CPW pins and add the points/directions to the lead-in/out arrays
-        self.set_pin("start")
-        self.set_pin("end")
-
-        # Align the lead-in/out to the input options set from the user
-        start_point = self.set_lead("start")
-        end_point = self.set_lead("end")
-
-        self.intermediate_pts = OrderedDict()
-        for arc_num, coord in anchors.items():
-            arc_pts = self.connect_simple(self.get_tip(), QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        arc_pts = self.connect_simple(self.get_tip(), end_point)
-        if arc_pts is not None:
-            self.intermediate_pts[len(anchors)] = np.array(arc_pts)
-
-        # concatenate all points, transforming the dictionary into a single numpy array
-        self.trim_pts()
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
-
-        # Make points into elements
-        self.make_elements(self.get_points())
+        # The other components stay put while this one is made. Their bounding
+        # boxes are only used by connect_simple() to avoid collisions.
+        self._avoid_collision = is_true(p.advanced.avoid_collision)
+        self._bbox_cache = (self._fetch_component_bboxes()
+                            if self._avoid_collision else None)
+
+        try:
+            # Set the CPW pins and add the points/directions to the lead-in/out arrays
+            self.set_pin("start")
+            self.set_pin("end")
+
+            # Align the lead-in/out to the input options set from the user
+            start_point = self.set_lead("start")
+            end_point = self.set_lead("end")
+
+            # Anchor coordinates as rows of a single Nx2 array
+            coords = np.fromiter(
+                (v for coord in anchors.values() for v in coord),
+                dtype=float).reshape(-1, 2)
+
+            self.intermediate_pts = OrderedDict()
+            for arc_num, coord in zip(anchors, coords):
+                arc_pts = self.connect_simple(self.get_tip(),
+                                              QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
+                else:
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            arc_pts = self.connect_simple(self.get_tip(), end_point)
+            if arc_pts is not None:
+                self.intermediate_pts[len(anchors)] = np.array(arc_pts)
+
+            # concatenate all points, transforming the dictionary into a single numpy array
+            self.trim_pts()
+            self.intermediate_pts = np.concatenate(list(
+                self.intermediate_pts.values()),
+                                                   axis=0)
+
+            # Make points into elements
+            self.make_elements(self.get_points())
+        finally:
+            self._avoid_collision = self._bbox_cache = None
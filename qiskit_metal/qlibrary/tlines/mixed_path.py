@@ -19,6 +19,7 @@ from qiskit_metal.qlibrary.core import QRoutePoint
 from collections import OrderedDict
 from .meandered import RouteMeander
 from .pathfinder import RoutePathfinder
+from qiskit_metal.toolbox_metal.parsing import is_true
 
 
 # class RouteMixed(RouteFramed, RoutePathfinder, RouteMeander):
@@ -103,82 +104,88 @@ class RouteMixed(RoutePathfinder, RouteMeander):
         p = self.parse_options()
         anchors = p.anchors
         between_anchors = p.between_anchors
-
-        # Set the CPW pins and add the points/directions to the lead-in/out arrays
-        self.set_pin("start")
-        self.set_pin("end")
-
-        # Align the lead-in/out to the input options set from the user
-        start_point = self.set_lead("start")
-        end_point = self.set_lead("end")
-
-        # approximate length needed for individual meanders
-        # the meander algorithm directly reads from self._length_segment
-        count_meanders_list = [
-            1 if x == "M" else 0 for x in list(between_anchors.values())
-        ]
-        self._length_segment = None
-        if any(count_meanders_list):
-            self._length_segment = ((self.p.total_length - (self.head.length + self.tail.length) \
-                                   - self.free_manhattan_length_anchors()) / sum(count_meanders_list)) \
-                                   + (self.free_manhattan_length_anchors() / len(count_meanders_list))
-
-        # find the points to connect between each pair of anchors, or between anchors and leads
-        # at first, store points "per segment" in a dictionary, so it is easier to apply length requirements
-        self.intermediate_pts = OrderedDict()
-        meanders = set()
-        for arc_num, coord in anchors.items():
-            # determine what is the connection strategy for this pair, based on user inputs
-            connect_method = self.select_connect_method(arc_num)
-            if connect_method == self.connect_meandered:
-                meanders.add(arc_num)
-            # compute points connecting the anchors, all but the last
-            arc_pts = connect_method(self.get_tip(), QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        # compute last connection point to the output QRouteLead
-        connect_method = self.select_connect_method(len(anchors))
-        if connect_method == self.connect_meandered:
-            meanders.add(len(anchors))
-        arc_pts = connect_method(self.get_tip(), end_point)
-        if arc_pts is not None:
-            self.intermediate_pts[len(anchors)] = np.array(arc_pts)
-
-        # concatenate all points, transforming the dictionary into a single numpy array
-        self.trim_pts()
-        dictionary_intermediate_pts = self.intermediate_pts
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
-
-        if any(count_meanders_list):
-            # refine length of meanders
-            total_delta_length = self.p.total_length - self.length
-            individual_delta_length = total_delta_length / len(meanders)
-            for m in meanders:
-                arc_pts = dictionary_intermediate_pts[m][:-1]
-                if m == 0:
-                    meander_start_point = start_point
+        # The other components stay put while this one is made
+        self._avoid_collision = is_true(p.advanced.avoid_collision)
+        self._bbox_cache = self._fetch_component_bboxes()
+
+        try:
+            # Set the CPW pins and add the points/directions to the lead-in/out arrays
+            self.set_pin("start")
+            self.set_pin("end")
+
+            # Align the lead-in/out to the input options set from the user
+            start_point = self.set_lead("start")
+            end_point = self.set_lead("end")
+
+            # approximate length needed for individual meanders
+            # the meander algorithm directly reads from self._length_segment
+            count_meanders_list = [
+                1 if x == "M" else 0 for x in list(between_anchors.values())
+            ]
+            self._length_segment = None
+            if any(count_meanders_list):
+                self._length_segment = ((self.p.total_length - (self.head.length + self.tail.length) \
+                                       - self.free_manhattan_length_anchors()) / sum(count_meanders_list)) \
+                                       + (self.free_manhattan_length_anchors() / len(count_meanders_list))
+
+            # find the points to connect between each pair of anchors, or between anchors and leads
+            # at first, store points "per segment" in a dictionary, so it is easier to apply length requirements
+            self.intermediate_pts = OrderedDict()
+            meanders = set()
+            for arc_num, coord in anchors.items():
+                # determine what is the connection strategy for this pair, based on user inputs
+                connect_method = self.select_connect_method(arc_num)
+                if connect_method == self.connect_meandered:
+                    meanders.add(arc_num)
+                # compute points connecting the anchors, all but the last
+                arc_pts = connect_method(self.get_tip(), QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
                 else:
-                    meander_start_point = QRoutePoint(anchors[m - 1])
-                if m == len(anchors):
-                    meander_end_point = end_point
-                else:
-                    meander_end_point = QRoutePoint(anchors[m])
-                dictionary_intermediate_pts[m] = self.adjust_length(
-                    individual_delta_length, arc_pts, meander_start_point,
-                    meander_end_point)
-                dictionary_intermediate_pts[m] = np.concatenate(
-                    [dictionary_intermediate_pts[m], [anchors[m]]], axis=0)
-        self.intermediate_pts = np.concatenate(list(
-            dictionary_intermediate_pts.values()),
-                                               axis=0)
-
-        # Make points into elements
-        self.make_elements(self.get_points())
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            # compute last connection point to the output QRouteLead
+            connect_method = self.select_connect_method(len(anchors))
+            if connect_method == self.connect_meandered:
+                meanders.add(len(anchors))
+            arc_pts = connect_method(self.get_tip(), end_point)
+            if arc_pts is not None:
+                self.intermediate_pts[len(anchors)] = np.array(arc_pts)
+
+            # concatenate all points, transforming the dictionary into a single numpy array
+            self.trim_pts()
+            dictionary_intermediate_pts = self.intermediate_pts
+            self.intermediate_pts = np.concatenate(list(
+                self.intermediate_pts.values()),
+                                                   axis=0)
+
+            if any(count_meanders_list):
+                # refine length of meanders
+                total_delta_length = self.p.total_length - self.length
+                individual_delta_length = total_delta_length / len(meanders)
+                for m in meanders:
+                    arc_pts = dictionary_intermediate_pts[m][:-1]
+                    if m == 0:
+                        meander_start_point = start_point
+                    else:
+                        meander_start_point = QRoutePoint(anchors[m - 1])
+                    if m == len(anchors):
+                        meander_end_point = end_point
+                    else:
+                        meander_end_point = QRoutePoint(anchors[m])
+                    dictionary_intermediate_pts[m] = self.adjust_length(
+                        individual_delta_length, arc_pts, meander_start_point,
+                        meander_end_point)
+                    dictionary_intermediate_pts[m] = np.concatenate(
+                        [dictionary_intermediate_pts[m], [anchors[m]]], axis=0)
+            self.intermediate_pts = np.concatenate(list(
+                dictionary_intermediate_pts.values()),
+                                                   axis=0)
+
+            # Make points into elements
+            self.make_elements(self.get_points())
+        finally:
+            self._avoid_collision = self._bbox_cache = None
 
     def select_connect_method(self, segment_num):
         """Translates the user-selected connection method into the right method
@@ -20,6 +20,7 @@ from .anchored_path import RouteAnchors
 from qiskit_metal.toolbox_metal import math_and_overrides as mao
 from collections import OrderedDict
 from qiskit_metal.toolbox_metal.exceptions import QiskitMetalDesignError
+from qiskit_metal.toolbox_metal.parsing import is_true
 
 
 class RoutePathfinder(RouteAnchors):
@@ -135,7 +136,8 @@ class RoutePathfinder(RouteAnchors):
                     # Ignore backward direction
                     curpt = current_path[-1]
                     nextpt = curpt + step_size * disp
-                    if self.unobstructed([curpt, nextpt]):
+                    if self.unobstructed_xy(curpt[0], curpt[1], nextpt[0],
+                                            nextpt[1]):
                         neighbors.append(nextpt)
             for neighbor in neighbors:
                 if tuple(neighbor) not in visited:
@@ -162,33 +164,39 @@ class RoutePathfinder(RouteAnchors):
         """Generates path from start pin to end pin."""
         p = self.parse_options()
         anchors = p.anchors
-
-        # Set the CPW pins and add the points/directions to the lead-in/out arrays
-        self.set_pin("start")
-        self.set_pin("end")
-
-        # Align the lead-in/out to the input options set from the user
-        start_point = self.set_lead("start")
-        end_point = self.set_lead("end")
-
-        self.intermediate_pts = OrderedDict()
-        for arc_num, coord in anchors.items():
-            arc_pts = self.connect_astar_or_simple(self.get_tip(),
-                                                   QRoutePoint(coord))
-            if arc_pts is None:
-                self.intermediate_pts[arc_num] = [coord]
-            else:
-                self.intermediate_pts[arc_num] = np.concatenate(
-                    [arc_pts, [coord]], axis=0)
-        arc_pts = self.connect_astar_or_simple(self.get_tip(), end_point)
-        if arc_pts is not None:
-            self.intermediate_pts[len(anchors)] = np.array(arc_pts)
-
-        # concatenate all points, transforming the dictionary into a single numpy array
-        self.trim_pts()
-        self.intermediate_pts = np.concatenate(list(
-            self.intermediate_pts.values()),
-                                               axis=0)
-
-        # Make points into elements
-        self.make_elements(self.get_points())
+        # The other components stay put while this one is made
+        self._avoid_collision = is_true(p.advanced.avoid_collision)
+        self._bbox_cache = self._fetch_component_bboxes()
+
+        try:
+            # Set the CPW pins and add the points/directions to the lead-in/out arrays
+            self.set_pin("start")
+            self.set_pin("end")
+
+            # Align the lead-in/out to the input options set from the user
+            start_point = self.set_lead("start")
+            end_point = self.set_lead("end")
+
+            self.intermediate_pts = OrderedDict()
+            for arc_num, coord in anchors.items():
+                arc_pts = self.connect_astar_or_simple(self.get_tip(),
+                                                       QRoutePoint(coord))
+                if arc_pts is None:
+                    self.intermediate_pts[arc_num] = [coord]
+                else:
+                    self.intermediate_pts[arc_num] = np.concatenate(
+                        [arc_pts, [coord]], axis=0)
+            arc_pts = self.connect_astar_or_simple(self.get_tip(), end_point)
+            if arc_pts is not None:
+                self.intermediate_pts[len(anchors)] = np.array(arc_pts)
+
+            # concatenate all points, transforming the dictionary into a single numpy array
+            self.trim_pts()
+            self.intermediate_pts = np.concatenate(list(
+                self.intermediate_pts.values()),
+                                                   axis=0)
+
+            # Make points into elements
+            self.make_elements(self.get_points())
+        finally:
+            self._avoid_collision = self._bbox_cache = None
@@ -20,6 +20,8 @@
 
 import unittest
 import numpy as np
+import shapely
+from shapely.strtree import STRtree
 
 from qiskit_metal.qlibrary.core import _parsed_dynamic_attrs
 from qiskit_metal import Dict
@@ -27,6 +29,7 @@ from qiskit_metal import draw
 from qiskit_metal.qlibrary._template import MyQComponent
 from qiskit_metal.qlibrary.core import QComponent
 from qiskit_metal.qlibrary.core import QRoute
+from qiskit_metal.qlibrary.core import QRoutePoint
 from qiskit_metal.qlibrary.core import BaseQubit
 from qiskit_metal.qlibrary.lumped.cap_n_interdigital import CapNInterdigital
 from qiskit_metal.qlibrary.couplers.coupled_line_tee import CoupledLineTee
@@ -541,12 +544,89 @@ class TestComponentFunctionality(unittest.TestCase, AssertionsMixin):
 
     def test_qlibrary_anchored_path_intersecting(self):
         """Test intersecting function in anchored_path.py"""
-        self.assertTrue(
-            anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
-                                       np.array([1, 3]), np.array([3, 1])))
-        self.assertFalse(
-            anchored_path.intersecting(np.array([1, 1]), np.array([3, 3]),
-                                       np.array([5, 5]), np.array([7, 7])))
+        self.assertTrue(anchored_path.intersecting(1, 1, 3, 3, 1, 3, 3, 1))
+        self.assertFalse(anchored_path.intersecting(1, 1, 3, 3, 5, 5, 7, 7))
+        # vertical colinear segments, overlapping or not
+        self.assertTrue(anchored_path.intersecting(0, 0, 0, 2, 0, 1, 0, 3))
+        self.assertFalse(anchored_path.intersecting(0, 0, 0, 1, 0, 2, 0, 3))
+        # horizontal colinear segments touching at an endpoint
+        self.assertTrue(anchored_path.intersecting(0, 0, 1, 0, 1, 0, 2, 0))
+        # T-junction, endpoint of one segment on the other one
+        self.assertTrue(anchored_path.intersecting(0, 0, 2, 0, 1, 0, 1, 2))
+        # parallel segments, offset from one another
+        self.assertFalse(anchored_path.intersecting(0, 0, 2, 0, 0, 1, 2, 1))
+        # zero-length segment, on and off the other segment
+        self.assertTrue(anchored_path.intersecting(1, 0, 1, 0, 0, 0, 2, 0))
+        self.assertFalse(anchored_path.intersecting(1, 1, 1, 1, 0, 0, 2, 0))
+
+    def test_qlibrary_anchored_path_segment_hits_bboxes(self):
+        """Test segment_hits_bboxes function in anchored_path.py"""
+        bboxes = np.array([[0, 0, 2, 2], [5, 5, 7, 7], [-1, -1, 4, 4],
+                           [3, 0, 4, 1]])
+        hits = anchored_path.segment_hits_bboxes(np.array([1, 1]),
+                                                 np.array([3, 3]), bboxes)
+        self.assertListEqual(hits.tolist(), [True, False, False, False])
+        hits = anchored_path.segment_hits_bboxes(np.array([0, 3]),
+                                                 np.array([3, 3]),
+                                                 np.empty((0, 4)))
+        self.assertEqual(hits.size, 0)
+
+    def test_qlibrary_anchored_path_segments_hit_bboxes_tree(self):
+        """Test that the STRtree lookup in anchored_path.py finds the same
+        hits as testing every bounding box."""
+        # 7x7 grid of unit boxes, spaced 1 apart
+        bboxes = np.array([[2 * i, 2 * j, 2 * i + 1, 2 * j + 1]
+                           for i in range(7)
+                           for j in range(7)],
+                          dtype=float)
+        self.assertGreaterEqual(len(bboxes), anchored_path.STRTREE_MIN_BOXES)
+        segments = np.array(
+            [
+                [[0, 1], [13, 1]],  # along the top edges of a row
+                [[2.5, -1], [2.5, 15]],  # across a column
+                [[0, 0], [13, 13]],  # through the corners
+                [[5, 0.5], [6, 0.5]],  # between two edges
+                [[1.2, 1.2], [1.8, 1.8]],  # in a gap
+                [[3, 3], [3, 3]],  # zero-length, on a corner
+                [[1.5, 1.5], [1.5, 1.5]],  # zero-length, in a gap
+                [[0.5, 0.5], [0.5, 0.5]],  # zero-length, inside a box
+            ],
+            dtype=float)
+        tree = STRtree(shapely.box(*bboxes.T))
+
+        hits = anchored_path._segments_hit_bboxes_tree(segments, bboxes, tree)
+        self.assertListEqual(
+            hits.tolist(),
+            anchored_path._segments_hit_bboxes(segments, bboxes).tolist())
+        self.assertListEqual(
+            hits.tolist(),
+            anchored_path.segment_hits_bboxes(segments[:, 0], segments[:, 1],
+                                              bboxes).tolist())
+        self.assertListEqual(
+            hits.sum(axis=1).tolist(), [7, 7, 7, 2, 0, 1, 0, 0])
+
+    def test_qlibrary_anchored_path_avoid_collision(self):
+        """Test that connect_simple() in anchored_path.py only routes around
+        other components when avoid_collision is true."""
+        design = designs.DesignPlanar()
+        MyQComponent(design,
+                     'obstacle',
+                     options=dict(width='0.4mm',
+                                  height='0.4mm',
+                                  pos_x='1.6mm',
+                                  pos_y='0mm'))
+        route = RouteAnchors(design, 'route', options={}, make=False)
+
+        def connect():
+            return route.connect_simple(
+                QRoutePoint(np.array([0., 0.]), np.array([1., 0.])),
+                QRoutePoint(np.array([2., 1.])))
+
+        # The shortest route passes through the obstacle
+        route.options.advanced.avoid_collision = 'false'
+        self.assertListEqual(connect().tolist(), [[2., 0.]])
+        route.options.advanced.avoid_collision = 'true'
+        self.assertListEqual(connect().tolist(), [[1., 0.], [1., 1.]])
 
     @staticmethod
     def generate_spiral_list(x: int, y: int):
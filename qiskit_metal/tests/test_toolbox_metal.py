@@ -25,6 +25,7 @@ from typing import Union
 from qiskit_metal.toolbox_metal import about
 from qiskit_metal.toolbox_metal import parsing
 from qiskit_metal.toolbox_metal import math_and_overrides
+from qiskit_metal.toolbox_metal import _geom_numba
 from qiskit_metal.toolbox_metal import bounds_for_path_and_poly_tables
 from qiskit_metal.toolbox_metal.bounds_for_path_and_poly_tables import BoundsForPathAndPolyTables
 from qiskit_metal.toolbox_metal.layer_stack_handler import LayerStackHandler
@@ -37,6 +38,7 @@ from qiskit_metal.tests.assertions import AssertionsMixin
 from qiskit_metal.qlibrary.qubits.transmon_concentric import TransmonConcentric
 from qiskit_metal.designs.design_multiplanar import MultiPlanar
 from qiskit_metal.qlibrary.qubits.transmon_pocket_6 import TransmonPocket6
+from qiskit_metal.qlibrary.tlines import anchored_path
 from qiskit_metal.tests.test_data.quad_coupler import QuadCoupler
 
 
@@ -833,6 +835,36 @@ class TestToolboxMetal(unittest.TestCase, AssertionsMixin):
                               (ls_file_path, None))._warning_search_minus_chip(
                                   5, 1, "FAIL"), None)
 
+    def test_toolbox_metal_geom_numba_segments_hit_bboxes(self):
+        """Test segments_hit_bboxes in _geom_numba.py against its numpy
+        counterpart in anchored_path.py."""
+        bboxes = np.array(
+            [[0, 0, 2, 2], [5, 5, 7, 7], [-1, -1, 4, 4], [3, 0, 4, 1]],
+            dtype=float)
+        segments = np.array(
+            [
+                [[1, 1], [3, 3]],  # crossing
+                [[2, -1], [2, 3]],  # along an edge
+                [[3, 0.5], [3, 0.5]],  # zero-length, on an edge
+                [[1, 1], [1, 1]],  # zero-length, inside
+                [[8, 0], [9, 0]],  # clear of all the boxes
+            ],
+            dtype=float)
+        expected = [[True, False, False, False], [True, False, True, False],
+                    [False, False, False, True], [False, False, False, False],
+                    [False, False, False, False]]
+
+        hits = _geom_numba.segments_hit_bboxes(segments.reshape(-1, 4), bboxes)
+        self.assertListEqual(hits.tolist(), expected)
+        self.assertListEqual(
+            hits.tolist(),
+            anchored_path.segment_hits_bboxes(segments[:, 0], segments[:, 1],
+                                              bboxes).tolist())
+        for segment, row in zip(segments, expected):
+            self.assertListEqual(
+                _geom_numba.segment_hits_bboxes(*segment.ravel(),
+                                                bboxes).tolist(), row)
+
     def test_toolbox_metal_layer_stack_handler_pilot_error(self):
         """Test functionality of layer_stack_handler_pilot_error in toolbox_metal.py."""
         ls_file_path = ("./qiskit_metal/tests/test_data/planar_chip.txt")
@@ -24,6 +24,7 @@ from qiskit_metal.toolbox_python.display import MetalTutorialMagics
 from qiskit_metal.toolbox_python import display
 from qiskit_metal.toolbox_python import utility_functions
 from qiskit_metal.toolbox_python._logging import LogStore
+from qiskit_metal.toolbox_python._logging import setup_logger
 
 
 class TestToolboxPython(unittest.TestCase):
@@ -44,6 +45,13 @@ class TestToolboxPython(unittest.TestCase):
         except Exception:
             self.fail("LogStore failed")
 
+    def test_setup_logger_once(self):
+        """Test that setup_logger only sets up a logger the first time."""
+        logger = setup_logger('test_setup_logger_once', '%(message)s', '%X')
+        again = setup_logger('test_setup_logger_once', '%(message)s', '%X')
+        self.assertIs(logger, again)
+        self.assertEqual(len(logger.handlers), 1)
+
     def test_instantiate_headings(self):
         """Test instantiation of Headings class."""
         try:
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Ahead-of-time compilation of the segment intersection kernels.
+
+Requires numba and a C compiler. Run once, for example after installing
+qiskit-metal in development mode:
+
+.. code-block:: bash
+
+    python -m qiskit_metal.toolbox_metal._geom_cc
+
+This builds the _geom_kernels extension module next to _geom_numba, which
+then uses it instead of compiling its kernels on first use.
+"""
+
+import importlib
+import os
+import sys
+
+KERNELS_MODULE = 'qiskit_metal.toolbox_metal._geom_kernels'
+NUMBA_MODULE = 'qiskit_metal.toolbox_metal._geom_numba'
+
+
+def build():
+    """Compiles the kernels of _geom_numba into the _geom_kernels extension
+    module, in the directory of this file."""
+    # pylint: disable=import-outside-toplevel,unused-variable
+    from numba.pycc import CC
+
+    # Compile from the numba kernels, even if _geom_kernels was built and
+    # imported before. Both modules are restored once done.
+    saved = {
+        name: sys.modules.pop(name, None)
+        for name in (KERNELS_MODULE, NUMBA_MODULE)
+    }
+    sys.modules[KERNELS_MODULE] = None
+    try:
+        _geom_numba = importlib.import_module(NUMBA_MODULE)
+
+        cc = CC('_geom_kernels')
+        cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+        @cc.export('segments_intersect', 'b1(f8, f8, f8, f8, f8, f8, f8, f8)')
+        def segments_intersect(ax, ay, bx, by, cx, cy, dx, dy):
+            """See _geom_numba.segments_intersect."""
+            return _geom_numba.segments_intersect(ax, ay, bx, by, cx, cy, dx,
+                                                  dy)
+
+        @cc.export('segment_hits_bboxes', 'b1[:](f8, f8, f8, f8, f8[:, :])')
+        def segment_hits_bboxes(ax, ay, bx, by, bboxes):
+            """See _geom_numba.segment_hits_bboxes."""
+            return _geom_numba.segment_hits_bboxes(ax, ay, bx, by, bboxes)
+
+        @cc.export('segments_hit_bboxes', 'b1[:, :](f8[:, :], f8[:, :])')
+        def segments_hit_bboxes(segments, bboxes):
+            """See _geom_numba.segments_hit_bboxes."""
+            return _geom_numba.segments_hit_bboxes(segments, bboxes)
+
+        cc.compile()
+    finally:
+        for name, module in saved.items():
+            sys.modules.pop(name, None)
+            if module is not None:
+                sys.modules[name] = module
+
+
+if __name__ == '__main__':
+    build()
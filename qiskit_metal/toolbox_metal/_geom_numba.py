@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2017, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Segment intersection kernels used by the routing algorithms.
+
+The kernels are taken from the _geom_kernels extension module when it has
+been built ahead of time (see _geom_cc), or else compiled with numba when it
+is installed. Otherwise they run as plain python and IS_COMPILED is False,
+so that callers can prefer their numpy implementation instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # pylint: disable=unused-argument
+        """Stand-in for numba.njit, returns the function unchanged."""
+        return lambda func: func
+
+
+@njit(cache=True)
+def orient(px: float, py: float, qx: float, qy: float, rx: float,
+           ry: float) -> float:
+    """Returns twice the signed area of triangle pqr: positive if r lies to
+    the left of the line pq, negative if to the right, 0 if colinear."""
+    return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+
+@njit(cache=True)
+def within(px: float, py: float, qx: float, qy: float, rx: float,
+           ry: float) -> bool:
+    """Returns whether point p projects inside segment qr on both axes."""
+    # Chained comparisons rather than min/max, which are function calls when
+    # running as plain python
+    return ((qx <= px <= rx or rx <= px <= qx) and
+            (qy <= py <= ry or ry <= py <= qy))
+
+
+@njit(cache=True)
+def segments_intersect(ax: float, ay: float, bx: float, by: float, cx: float,
+                       cy: float, dx: float, dy: float) -> bool:
+    """Returns whether segment ab intersects or overlaps with segment cd.
+
+    Args:
+        ax, ay, bx, by (float): Coordinates of the endpoints of the 1st segment
+        cx, cy, dx, dy (float): Coordinates of the endpoints of the 2nd segment
+
+    Returns:
+        bool: True if intersecting, False otherwise
+    """
+    o1 = orient(ax, ay, bx, by, cx, cy)
+    o2 = orient(ax, ay, bx, by, dx, dy)
+    o3 = orient(cx, cy, dx, dy, ax, ay)
+    o4 = orient(cx, cy, dx, dy, bx, by)
+    # Proper crossing: each segment straddles the line through the other one.
+    # Otherwise the segments can only meet where an endpoint of one lies on
+    # the other, which also covers colinear overlaps.
+    return ((o1 * o2 < 0 and o3 * o4 < 0) or
+            (o1 == 0 and within(cx, cy, ax, ay, bx, by)) or
+            (o2 == 0 and within(dx, dy, ax, ay, bx, by)) or
+            (o3 == 0 and within(ax, ay, cx, cy, dx, dy)) or
+            (o4 == 0 and within(bx, by, cx, cy, dx, dy)))
+
+
+@njit(cache=True)
+def segment_hits_bboxes(ax: float, ay: float, bx: float, by: float,
+                        bboxes: np.ndarray) -> np.ndarray:
+    """Returns, for each axis-aligned bounding box, whether segment ab
+    intersects or overlaps with its perimeter.
+
+    Args:
+        ax, ay, bx, by (float): Coordinates of the endpoints of the segment
+        bboxes (np.ndarray): Mx4 float array of (xmin, ymin, xmax, ymax) rows
+
+    Returns:
+        np.ndarray: Boolean mask of length M, True where the perimeter is hit
+    """
+    sx0, sx1 = (ax, bx) if ax < bx else (bx, ax)
+    sy0, sy1 = (ay, by) if ay < by else (by, ay)
+    hits = np.zeros(bboxes.shape[0], dtype=np.bool_)
+    for i in range(bboxes.shape[0]):
+        xmin = bboxes[i, 0]
+        ymin = bboxes[i, 1]
+        xmax = bboxes[i, 2]
+        ymax = bboxes[i, 3]
+        if xmax < sx0 or xmin > sx1 or ymax < sy0 or ymin > sy1:
+            continue
+        hits[i] = (segments_intersect(ax, ay, bx, by, xmin, ymin, xmin, ymax) or
+                   segments_intersect(ax, ay, bx, by, xmin, ymin, xmax, ymin) or
+                   segments_intersect(ax, ay, bx, by, xmax, ymin, xmax, ymax) or
+                   segments_intersect(ax, ay, bx, by, xmin, ymax, xmax, ymax))
+    return hits
+
+
+@njit(cache=True)
+def segments_hit_bboxes(segments: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+    """Returns, for each segment and each axis-aligned bounding box, whether
+    the segment intersects or overlaps with the perimeter of the box.
+
+    Args:
+        segments (np.ndarray): Sx4 float array of (ax, ay, bx, by) rows
+        bboxes (np.ndarray): Mx4 float array of (xmin, ymin, xmax, ymax) rows
+
+    Returns:
+        np.ndarray: SxM boolean mask, True where the perimeter is hit
+    """
+    hits = np.zeros((segments.shape[0], bboxes.shape[0]), dtype=np.bool_)
+    for i in range(segments.shape[0]):
+        hits[i] = segment_hits_bboxes(segments[i, 0], segments[i, 1],
+                                      segments[i, 2], segments[i, 3], bboxes)
+    return hits
+
+
+try:
+    # Built ahead of time by _geom_cc, which avoids the JIT compilation on first use
+    from qiskit_metal.toolbox_metal._geom_kernels import (  # pylint: disable=no-name-in-module
+        segments_intersect, segment_hits_bboxes, segments_hit_bboxes)
+    IS_COMPILED = True
+except ImportError:
+    IS_COMPILED = HAS_NUMBA
@@ -17,10 +17,15 @@ Mostly internal.
 """
 
 import logging, collections
-from typing import List
+import threading
+from typing import Dict, List
 
 __all__ = ['setup_logger', 'LogStore']
 
+# Loggers already set up by setup_logger, by name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+_LOGGER_LOCK = threading.Lock()
+
 
 def setup_logger(logger_name,
                  log_format,
@@ -62,41 +67,51 @@ def setup_logger(logger_name,
         print(gui._log_handler)
     """
 
-    logger = logging.getLogger(logger_name)  # singleton
+    if not force_set:
+        logger = _LOGGER_CACHE.get(logger_name)
+        if logger is not None:
+            return logger
+
+    with _LOGGER_LOCK:
+        logger = logging.getLogger(logger_name)  # singleton
+
+        if force_set or not len(logger.handlers):
 
-    if force_set or not len(logger.handlers):
+            logger.setLevel(level_base)
 
-        logger.setLevel(level_base)
+            # Used to integrate logging with the warnings module.
+            # Warnings issued by the warnings module will be redirected to the logging system.
+            # Specifically, a warning will be formatted using warnings.formatwarning() and the resulting
+            # string logged to a logger named 'py.warnings' with a severity of WARNING.
+            if capture_warnings is not None:
+                logging.captureWarnings(capture_warnings)
 
-        # Used to integrate logging with the warnings module.
-        # Warnings issued by the warnings module will be redirected to the logging system.
-        # Specifically, a warning will be formatted using warnings.formatwarning() and the resulting
-        # string logged to a logger named 'py.warnings' with a severity of WARNING.
-        if capture_warnings is not None:
-            logging.captureWarnings(capture_warnings)
+            # Jupyter notebooks already has a stream handler on the default log.
+            # Do not propage upstream to the root logger.
+            # https://stackoverflow.com/questions/31403679/python-logging-module-duplicated-console-output-ipython-notebook-qtconsole
+            logger.propagate = propagate
 
-        # Jupyter notebooks already has a stream handler on the default log.
-        # Do not propage upstream to the root logger.
-        # https://stackoverflow.com/questions/31403679/python-logging-module-duplicated-console-output-ipython-notebook-qtconsole
-        logger.propagate = propagate
+            if create_stream:
+                # Sends logging output to streams such as sys.stdout,
+                # sys.stderr or any file-like object
+                c_handler = logging.StreamHandler()
 
-        if create_stream:
-            # Sends logging output to streams such as sys.stdout,
-            # sys.stderr or any file-like object
-            c_handler = logging.StreamHandler()
+                # Format. Unlike the root logger, a custom logger can't be configured
+                # using basicConfig().
+                c_format = logging.Formatter(log_format, datefmt=log_datefmt)
+                c_handler.setFormatter(c_format)
 
-            # Format. Unlike the root logger, a custom logger can't be configured
-            # using basicConfig().
-            c_format = logging.Formatter(log_format, datefmt=log_datefmt)
-            c_handler.setFormatter(c_format)
+                # Add Hanlder with format and set level
+                logger.addHandler(c_handler)
+                c_handler.setLevel(level_stream)
 
-            # Add Hanlder with format and set level
-            logger.addHandler(c_handler)
-            c_handler.setLevel(level_stream)
+                # save references for ease
+                logger.zkm_c_handler = c_handler
+                logger.zkm_c_format = c_format
 
-            # save references for ease
-            logger.zkm_c_handler = c_handler
-            logger.zkm_c_format = c_format
+        # Once it has handlers, setting up the logger again is a no-op
+        if len(logger.handlers):
+            _LOGGER_CACHE[logger_name] = logger
 
     return logger
 